@@ -1,14 +1,15 @@
 #TODO  Štýly - lepší výzor
-#      RDS - cez INT
 import sys
 import os
+import functools
 import fmsi4703
+import radiobridge
 from PySide.QtGui import (QWidget, QMainWindow, QLabel, QPushButton, QVBoxLayout,
                           QHBoxLayout, QSlider, QIcon, QPixmap, QFont, QApplication) 
-from PySide.QtCore import Qt, QTimer
+from PySide.QtCore import Qt
 
 
-dev_radio = fmsi4703.FMSi4703()
+dev_radio = fmsi4703.FMSi4703(area=os.environ.get("FMRADIO_BAND", "EU"))
 script_path = os.path.dirname(os.path.realpath(__file__)) 
 
 def map_range(oldval, oldmin, oldmax, newmin, newmax):
@@ -16,11 +17,16 @@ def map_range(oldval, oldmin, oldmax, newmin, newmax):
     newrange = (newmin - newmax)  
     return (((oldval - oldmin) * newrange) / oldrange) + newmin
 
+@functools.lru_cache(maxsize=None)
+def format_frekv(frekv, template="{:.2f}"):
+    return template.format(frekv / 100)
+
 class RadioApp(QWidget):
     
     def __init__(self):
         super().__init__()
         self.edit = False
+        self.events = radiobridge.RadioBridge(dev_radio)
 
         self.left_dock_create()
         self.middle_dock_create()
@@ -39,6 +45,8 @@ class RadioApp(QWidget):
 
     def left_dock_create(self):
         self.statlabel = QLabel("RSSI: --")
+        self.stereolabel = QLabel("Mono")
+        self.stereolabel.setFont(QFont("DejaVu Sans", 12))
         self.logolabel = QLabel()
         self.logolabel.setPixmap(QPixmap(os.path.join(script_path, "../assets/logo.png")))
         self.statlabel.setFont(QFont("DejaVu Sans", 12))
@@ -53,6 +61,7 @@ class RadioApp(QWidget):
         self.volbalayout = QVBoxLayout()
         self.volbalayout.addWidget(self.logolabel)
         self.volbalayout.addWidget(self.statlabel)
+        self.volbalayout.addWidget(self.stereolabel)
         for btn in self.btnvolba:
             self.volbalayout.addWidget(btn)
         self.volbalayout.addWidget(self.presetaddbtn)
@@ -61,7 +70,7 @@ class RadioApp(QWidget):
     def middle_dock_create(self):
         self.frekv = QLabel()
         self.frekv.setFont(QFont("DejaVu Sans", 26))
-        self.write_frekv()
+        self.frekv.setText("<b>--.-- MHz</b>")
 
         self.btnstepleft = QPushButton("<")
         self.btnseekdown = QPushButton("<<")
@@ -74,6 +83,12 @@ class RadioApp(QWidget):
         self.laybtnmv.addWidget(self.btnstepright)
         self.laybtnmv.addWidget(self.btnseekup)
        
+        self.labelrdsps = QLabel()
+        self.labelrdsps.setFont(QFont("DejaVu Sans", 14))
+        self.labelrdsps.setAlignment(Qt.AlignCenter)
+        self.labelrdstxt = QLabel()
+        self.labelrdstxt.setFont(QFont("DejaVu Sans", 10))
+        self.labelrdstxt.setWordWrap(True)
         self.labelrdsdt = QLabel("RDS")
         self.labelrdsdt.setFont(QFont("DejaVu Sans", 12))
        
@@ -84,6 +99,8 @@ class RadioApp(QWidget):
         self.middlelayout = QVBoxLayout()
         self.middlelayout.addLayout(self.frekvlayout)
         self.middlelayout.addLayout(self.laybtnmv)
+        self.middlelayout.addWidget(self.labelrdsps)
+        self.middlelayout.addWidget(self.labelrdstxt)
         self.middlelayout.addWidget(self.labelrdsdt)
 
 
@@ -114,13 +131,20 @@ class RadioApp(QWidget):
         self.btnonoff.clicked.connect(self.reset_radio)
         for btn in self.btnvolba:
             btn.clicked.connect(self.preset_choose)
-        self.timerrssi = QTimer()
-        self.timerrssi.timeout.connect(self.write_stats)
-        self.timerrssi.start(3000) # ms
+
+        # Driver callbacks may come from the GPIO thread -> always queue
+        self.events.frequencyChanged.connect(self.write_frekv, Qt.QueuedConnection)
+        self.events.rssiChanged.connect(self.write_stats, Qt.QueuedConnection)
+        self.events.stereoChanged.connect(self.write_stereo, Qt.QueuedConnection)
+        self.events.psnameChanged.connect(self.rds_psshow, Qt.QueuedConnection)
+        self.events.rdstextChanged.connect(self.rds_txtshow, Qt.QueuedConnection)
+        self.events.rdstimeChanged.connect(self.rds_tmshow, Qt.QueuedConnection)
 
     def reset_radio(self):
+        frekv = dev_radio.tunedfrequency()
         dev_radio.shutdown()
         dev_radio.poweron()
+        dev_radio.setfrequency(frekv)
 
     def preset_editmode(self):
         if self.edit == True:
@@ -140,24 +164,23 @@ class RadioApp(QWidget):
     def preset_set(self):
         button = self.sender()
         if isinstance(button, QPushButton):
-            button.setText("{:.2f}".format(dev_radio.getfrequency() / 100))
+            button.setText(format_frekv(dev_radio.tunedfrequency()))
             self.preset_editmode()
 
     def preset_choose(self):        
         button = self.sender()
         if isinstance(button, QPushButton):
             try:
-                frekv = int(float(button.text()) * 100)
+                frekv = round(float(button.text()) * 100)
             except ValueError:
                 return
             dev_radio.setfrequency(frekv)
-            self.write_frekv()
 
     def preset_save(self):
         with open("preset.txt", mode="w") as fw:
             for btn in self.btnvolba:
                 try:
-                    fw.write("{},".format(int(float(btn.text()) * 100)))
+                    fw.write("{},".format(round(float(btn.text()) * 100)))
                 except ValueError:
                     fw.write(" ,")
 
@@ -175,7 +198,7 @@ class RadioApp(QWidget):
 
         for i, btn in enumerate(self.btnvolba):
             try:
-                btn.setText("{:.2f}".format(int(pres_list[i])/100))
+                btn.setText(format_frekv(int(pres_list[i])))
             except ValueError:
                 continue
 
@@ -184,26 +207,23 @@ class RadioApp(QWidget):
             dev_radio.seekup()
         elif direction == "d":
             dev_radio.seekdown()
-        self.write_frekv()
 
     def step_frekv(self, direction):
-        curr_frekv = dev_radio.getfrequency()
-        if direction == "u":
-            curr_frekv += 10
-            if curr_frekv > dev_radio.freqhigh:
-                curr_frekv = dev_radio.freqlow
-        elif direction == "d":
-            curr_frekv -= 10
-            if curr_frekv < dev_radio.freqlow:
-                curr_frekv = dev_radio.freqhigh
-        dev_radio.setfrequency(curr_frekv)
-        self.write_frekv()    
+        curr_frekv = dev_radio.tunedfrequency()
+        dev_radio.setfrequency(dev_radio.nextfrequency(curr_frekv, direction == "u"))
+
+    def write_frekv(self, frekv): 
+        self.frekv.setText(format_frekv(frekv, "<b>{:.2f} MHz</b>"))
+        # RDS údaje patria predchádzajúcej stanici
+        self.labelrdsps.setText("")
+        self.labelrdstxt.setText("")
+        self.labelrdsdt.setText("RDS")
 
-    def write_frekv(self): 
-        self.frekv.setText("<b>{:.2f} MHz</b>".format(dev_radio.getfrequency() / 100))
+    def write_stats(self, rssi):
+        self.statlabel.setText("<b>RSSI: {}</b>".format(rssi))
 
-    def write_stats(self):
-        self.statlabel.setText("<b>RSSI: {}</b>".format(dev_radio.getrssi()))
+    def write_stereo(self, stereo):
+        self.stereolabel.setText("Stereo" if stereo else "Mono")
 
     def set_radiovolume(self):
         vol_percent = self.slidvol.value()
@@ -212,13 +232,13 @@ class RadioApp(QWidget):
         dev_radio.setvolume(new_volume)    
     
     def rds_psshow(self, station):
-        print("Stanica: {}".format(station))
+        self.labelrdsps.setText("<b>{}</b>".format(station))
 
     def rds_txtshow(self, text):
-        print("Text: {}".format(text))
+        self.labelrdstxt.setText(text)
 
     def rds_tmshow(self, hodiny, minuty):
-        print("{}:{}".format(hodiny, minuty))
+        self.labelrdsdt.setText("RDS {:02d}:{:02d}".format(hodiny % 24, minuty))
 
 
 class MyWindow(QMainWindow):
@@ -235,10 +255,6 @@ if __name__ == "__main__":
     okno = MyWindow()
     dev_radio.poweron()
     dev_radio.setfrequency(10180)
-    dev_radio.rds_setcallback(psname=okno.app.rds_psshow, 
-                              text=okno.app.rds_txtshow,
-                              time=okno.app.rds_tmshow)
-    okno.app.write_frekv()
     okno.app.set_radiovolume()
     okno.app.preset_restore()
 
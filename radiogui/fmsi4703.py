@@ -15,6 +15,7 @@
 """
 
 import time
+import threading
 import smbus
 import RPi.GPIO as GPIO
 
@@ -64,8 +65,17 @@ SEEKTH_MIN  =    0x0000
 SEEKTH_MID  =    0x1000
 SEEKTH_MAX  =    0x7F00
 
+BAND_MASK =      0x00C0
+BAND_USEU =      0x0000  # 87.5 - 108 MHz
+BAND_JPW  =      0x0040  # 76 - 108 MHz
+BAND_JP   =      0x0080  # 76 - 90 MHz
+
 SPACE1 =         5
 SPACE0 =         4
+SPACE_MASK =     0x0030
+SPACE_200  =     0x0000
+SPACE_100  =     0x0010
+SPACE_50   =     0x0020
 
 # Register 0x06 - SYSCONFIG3 
 SKSNR_MASK =     0x00F0
@@ -80,6 +90,31 @@ SKCNT_MIN  =     0x000F
 SKCNT_MID  =     0x0003
 SKCNT_MAX  =     0x0001
 
+# Seek profiles: (SEEKTH, SKSNR, SKCNT) already shifted into register place
+# Lower SEEKTH, lower SKSNR and lower SKCNT all mean more stops:
+# "rural" stops on weak stations, "urban" rejects more noise and impulses
+SEEK_PROFILES = {
+    "rural":   (0x0C00, 0x0020, 0x0001),
+    "default": (SEEKTH_MID, SKSNR_MID, SKCNT_MID),
+    "urban":   (0x1900, 0x0060, 0x0008),
+}
+STATION_MARGIN = 10     # RSSI above noise floor to count as a station
+
+# Seek outcomes for SeekRecorder
+SEEK_STATION   = "station"
+SEEK_FALSESTOP = "falsestop"    # stopped on an invalid channel
+SEEK_FAIL      = "fail"         # SFBL, nothing found in the whole band
+
+# Band plans: (low, high, spacing) in 10 kHz units, BAND, SPACE, de-emphasis us
+# Lowest frequency is channel 0 of the BAND setting
+BAND_PLANS = {
+    "EU":   (8750, 10800, 10, BAND_USEU, SPACE_100, 50),
+    "EU50": (8750, 10800, 5,  BAND_USEU, SPACE_50,  50),
+    "US":   (8750, 10790, 20, BAND_USEU, SPACE_200, 75),
+    "JP":   (7600, 9000,  10, BAND_JP,   SPACE_100, 50),
+    "JPW":  (7600, 10800, 10, BAND_JPW,  SPACE_100, 50),
+}
+
 # Register 0x0A - STATUSRSSI 
 RDSR =          0x8000  # RDS ready 
 STC  =          0x4000  # Seek Tune Complete 
@@ -90,23 +125,57 @@ SI   =          0x0100  # Stereo Indicator
 RSSI =          0x00FF
 
 
+class SeekRecorder:
+    """
+    Collects seek duration, hop count (channels passed) and outcome
+    for every seek profile
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.records = {}   # profile: [(duration, hops, outcome), ...]
+
+    def record(self, profile, duration, hops, outcome):
+        self.records.setdefault(profile, []).append((duration, hops, outcome))
+
+    def summary(self, profile):
+        rec = self.records.get(profile, [])
+        if not rec:
+            return None
+        count = len(rec)
+        fails = sum(1 for r in rec if r[2] == SEEK_FAIL)
+        stops = count - fails
+        falsestops = sum(1 for r in rec if r[2] == SEEK_FALSESTOP)
+        return {
+            "seeks": count,
+            "duration": sum(r[0] for r in rec) / count,    # s
+            "hops": sum(r[1] for r in rec) / count,
+            "fails": fails / count,
+            "falsestops": falsestops / stops if stops else 0.0,
+        }
+
+
 class FMSi4703:
 
     def __init__(self, i2caddr=0x10, resetpin=5, rdsintpin=6 ,area="EU"):
         self.i2caddr = i2caddr
         self.i2cbus  = smbus.SMBus(1)
         self.rstpin  = resetpin
-        self.area    = area
-        self.freqlow = 8750
-        self.freqhigh = 10800
+        self.__setplan(area)
+        self.channel = 0    # READCHAN at last STC, see tunedfrequency
         self.mono    = False
+        self.seekprofile = "default"
+        self.seekstats = SeekRecorder()
+        self.noisefloor = None  # RSSI median from the last calibrateseek
+        self.rdsINT  = rdsintpin
+        # RDS interrupt runs on the RPi.GPIO thread, every read-modify-write
+        # of the register shadow has to hold this lock
+        self.__lock = threading.RLock()
         self.rds_init() 
         self.rds_setcallback()
-      
-        if self.area == "EU":
-            self.freqsteps = 10
-        elif self.area == "US":
-            self.freqsteps = 20
+        self.status_setcallback()
 
         self.__registers = [0] * 16
 
@@ -115,91 +184,128 @@ class FMSi4703:
         GPIO.setup(self.rstpin, GPIO.OUT)
         GPIO.setup(0, GPIO.OUT)
 
-        if rdsintpin != None:
-            self.rdsINT = rdsintpin
+        if self.rdsINT != None:
             self.rds_setinterrupt()
     
     def poweron(self):
-        # To get the Si4703 inito 2-wire mode, SEN needs to be high and SDIO
-        # needs to be low after a reset
-        # The breakout board has SEN pulled high, but also has SDIO
-        # pulled high. Therefore, after a normal power up
-        # The Si4703 will be in an unknown state. RST must be controlled
-
-        GPIO.output(0, GPIO.LOW) #or pin 2 (SDIO)
-        time.sleep(0.1)
-        GPIO.output(self.rstpin, GPIO.LOW)
-        time.sleep(0.1)
-        GPIO.output(self.rstpin, GPIO.HIGH)
-        time.sleep(0.1)
+        with self.__lock:
+            # To get the Si4703 inito 2-wire mode, SEN needs to be high and SDIO
+            # needs to be low after a reset
+            # The breakout board has SEN pulled high, but also has SDIO
+            # pulled high. Therefore, after a normal power up
+            # The Si4703 will be in an unknown state. RST must be controlled
+
+            GPIO.output(0, GPIO.LOW) #or pin 2 (SDIO)
+            time.sleep(0.1)
+            GPIO.output(self.rstpin, GPIO.LOW)
+            time.sleep(0.1)
+            GPIO.output(self.rstpin, GPIO.HIGH)
+            time.sleep(0.1)
 
-        self.__readregisters()
-        self.__registers[0x07] = 0x8100    # Enable the oscillator, from AN230 page 12, rev 0.9
-        self.__writeregisters()
+            self.__readregisters()
+            self.__registers[0x07] = 0x8100    # Enable the oscillator, from AN230 page 12, rev 0.9
+            self.__writeregisters()
 
-        time.sleep(0.5)                 # Wait for clock to settle - from AN230 page 12
+            time.sleep(0.5)                 # Wait for clock to settle - from AN230 page 12
         
-        self.__readregisters()
-        self.__registers[POWERCFG] = 0x4001               # Enable the IC 
-        self.__registers[SYSCONFIG1] |= (1 << RDS)      # Enable RDS
-
-        if self.area == "EU":
-            self.__registers[SYSCONFIG1] |= (1 << DE)      # 50kHz Europe setup 
-            self.__registers[SYSCONFIG2] |= (1 << SPACE0)  # 100kHz channel spacing
-        elif self.area == "US":
-            self.__registers[SYSCONFIG2] &= ~(1 << SPACE1 | 1 << SPACE0)
-
-        self.__registers[SYSCONFIG2] &= 0xFFF0 # Clear volume bits
-        self.__registers[SYSCONFIG2] |= 0x0001 # Set volume to lowest
-        self.__registers[SYSCONFIG2] |= SEEKTH_MID;    
-
-
-        # set seek parameters
-        self.__registers[SYSCONFIG3] &= ~(SKSNR_MASK)  # Clear seek mask bits
-        self.__registers[SYSCONFIG3] |= SKSNR_MID      # Set volume
-
-        self.__registers[SYSCONFIG3] &= ~(SKCNT_MASK)  # Clear seek mask bits
-        self.__registers[SYSCONFIG3] |= SKCNT_MID;     # Set volume
-
-        self.__writeregisters()
-        time.sleep(0.11)
+            self.__readregisters()
+            self.__registers[POWERCFG] = 0x4001               # Enable the IC 
+            self.__registers[SYSCONFIG1] |= (1 << RDS)      # Enable RDS
+            if self.rdsINT != None:
+                # Reset clears the interrupt setup, RDS ready pulses on GPIO2
+                self.__registers[SYSCONFIG1] |= (1 << RDSIEN) | (1 << GPIO2)
+
+            self.__setbandregisters()
+            self.__registers[SYSCONFIG2] &= 0xFFF0 # Clear volume bits
+            self.__registers[SYSCONFIG2] |= 0x0001 # Set volume to lowest
+            self.__setseekregisters()
+            self.__writeregisters()
+            time.sleep(0.11)
 
     def shutdown(self):
-        self.__readregisters()
-        # Powerdown as defined in AN230 page 13 rev 0.9
-        self.__registers[TEST1] = 0x7C04    # Power down the IC
-        self.__registers[POWERCFG] = 0x002A # Power down the IC
-        self.__registers[SYSCONFIG1] = 0x0041 # Power down the IC
-        self.__writeregisters()
+        with self.__lock:
+            self.__readregisters()
+            # Powerdown as defined in AN230 page 13 rev 0.9
+            self.__registers[TEST1] = 0x7C04    # Power down the IC
+            self.__registers[POWERCFG] = 0x002A # Power down the IC
+            self.__registers[SYSCONFIG1] = 0x0041 # Power down the IC
+            self.__writeregisters()
 
     def setvolume(self, volume):
-        self.__readregisters()
-        if (volume < 0): volume = 0
-        if (volume > 15): volume = 15
-        self.volume = volume
+        with self.__lock:
+            self.__readregisters()
+            if (volume < 0): volume = 0
+            if (volume > 15): volume = 15
+            self.volume = volume
+
+            self.__registers[SYSCONFIG2] &= 0xFFF0      # Clear volume bits
+            self.__registers[SYSCONFIG2] |= volume      # Set new volume
+            self.__writeregisters()
 
-        self.__registers[SYSCONFIG2] &= 0xFFF0      # Clear volume bits
-        self.__registers[SYSCONFIG2] |= volume      # Set new volume
-        self.__writeregisters()
-    
     def getvolume(self):
-        self.__readregisters()
-        return (self.__registers[SYSCONFIG2] & 0x000F)
-    
-    def setfrequency(self, newfreq): 
+        with self.__lock:
+            self.__readregisters()
+            return (self.__registers[SYSCONFIG2] & 0x000F)
+
+    def setbandplan(self, area):
         """
-        newchannel = channel * 10   # e.g. 973 * 10 = 9730
-        newchannel -= 8750          # e.g. 9730 - 8750 = 980
-        newchannel //= 10;           # e.g. 980 / 10 = 98
+        Switch band plan on a running chip and retune to the current
+        frequency, or the nearest one inside the new band
         """
-        if newfreq < self.freqlow: 
-            newfreq = self.freqlow
-        elif newfreq > self.freqhigh:
-            newfreq = self.freqhigh
+        with self.__lock:
+            freq = self.tunedfrequency()
+            self.__setplan(area)
+            self.__readregisters()
+            self.__setbandregisters()
+            self.__writeregisters()
+            self.setfrequency(freq)
+
+    def __setbandregisters(self):
+        band, space, deemphasis = BAND_PLANS[self.area][3:]
+        if deemphasis == 50:
+            self.__registers[SYSCONFIG1] |= (1 << DE)      # 50us de-emphasis
+        else:
+            self.__registers[SYSCONFIG1] &= ~(1 << DE)     # 75us de-emphasis
+        self.__registers[SYSCONFIG2] &= ~(BAND_MASK | SPACE_MASK)
+        self.__registers[SYSCONFIG2] |= band | space    # Band limits and spacing
+
+    def __setplan(self, area):
+        if area not in BAND_PLANS:
+            raise ValueError("Unknown band plan: {}".format(area))
+        self.area = area
+        self.freqlow, self.freqhigh, self.freqsteps = BAND_PLANS[area][:3]
+        # channel -> frequency and back
+        self.freqs = tuple(range(self.freqlow, self.freqhigh + 1, self.freqsteps))
+        self.__channels = {freq: ch for ch, freq in enumerate(self.freqs)}
+
+    def freq2channel(self, freq):
+        """
+        freq = 9730 (EU) -> channel 98, off-grid frequency goes to nearest
+        """
+        if freq in self.__channels:
+            return self.__channels[freq]
+        if freq <= self.freqlow:
+            return 0
+        if freq >= self.freqhigh:
+            return len(self.freqs) - 1
+        return (freq - self.freqlow + self.freqsteps // 2) // self.freqsteps
+
+    def channel2freq(self, channel):
+        return self.freqs[min(channel, len(self.freqs) - 1)]
+
+    def nextfrequency(self, freq, up=True):
+        # One channel step, wraps around at band limits
+        channel = self.freq2channel(freq) + (1 if up else -1)
+        return self.freqs[channel % len(self.freqs)]
 
+    def setfrequency(self, newfreq): 
+        with self.__lock:
+            self.__tune(self.freq2channel(newfreq))
+            self.__tunenotify()
+
+    def __tune(self, newchannel):
         # These steps come from AN230 page 20 rev 0.9
         self.__readregisters()
-        newchannel = (newfreq - self.freqlow) // self.freqsteps
         self.__registers[CHANNEL] &= 0xFE00     # Clear out the channel bits
         self.__registers[CHANNEL] |= newchannel # Mask in the new channel
         self.__registers[CHANNEL] |= (1 << TUNE) # Set the TUNE bit to start
@@ -207,10 +313,74 @@ class FMSi4703:
         self.__waitforset()
 
     def getfrequency(self):
-        self.__readregisters()
-        channel = self.__registers[READCHAN] & 0x03FF #Mask out everything but the lower 10 bits
-        freq = (channel * self.freqsteps) + self.freqlow
-        return (freq)
+        with self.__lock:
+            self.__readregisters()
+            channel = self.__registers[READCHAN] & 0x03FF #Mask out everything but the lower 10 bits
+            return self.channel2freq(channel)
+
+    def tunedfrequency(self):
+        """
+        Frequency from the last tune or seek, without I2C read
+        """
+        return self.channel2freq(self.channel)
+
+    def setseekprofile(self, profile):
+        with self.__lock:
+            if profile not in SEEK_PROFILES:
+                raise ValueError("Unknown seek profile: {}".format(profile))
+            self.seekprofile = profile
+            self.__readregisters()
+            self.__setseekregisters()
+            self.__writeregisters()
+
+    def __setseekregisters(self):
+        seekth, sksnr, skcnt = SEEK_PROFILES[self.seekprofile]
+        self.__registers[SYSCONFIG2] &= ~(SEEKTH_MASK)  # Clear seek threshold
+        self.__registers[SYSCONFIG2] |= seekth
+        self.__registers[SYSCONFIG3] &= ~(SKSNR_MASK)   # Clear seek SNR bits
+        self.__registers[SYSCONFIG3] |= sksnr
+        self.__registers[SYSCONFIG3] &= ~(SKCNT_MASK)   # Clear impulse count bits
+        self.__registers[SYSCONFIG3] |= skcnt
+
+    def bandscan(self):
+        """
+        Tune every channel in the band and return [(freq, rssi), ...]
+        Frequency callback is not called, original frequency is restored
+        """
+        with self.__lock:
+            origchannel = self.channel
+            scan = []
+            for channel, freq in enumerate(self.freqs):
+                self.__tune(channel)
+                scan.append((freq, self.getrssi()))
+            self.__tune(origchannel)
+            return scan
+
+    def calibrateseek(self, scan=None):
+        """
+        Choose the seek profile for this location. Stations are RSSI peaks
+        standing out of the noise floor (median), each profile is judged by
+        how many peaks its SEEKTH would stop on. The closest one is set.
+        """
+        if scan == None:
+            scan = self.bandscan()
+        rssi = [r for f, r in scan]
+        floor = sorted(rssi)[len(rssi) // 2]
+        self.noisefloor = floor
+        peaks = [rssi[i] for i in range(len(rssi))
+                 if rssi[i] >= max(rssi[max(i - 1, 0):i + 2])]
+        stations = len([r for r in peaks if r >= floor + STATION_MARGIN])
+
+        # strictest first, so ties go to the profile with fewer stops
+        best = None
+        for profile in sorted(SEEK_PROFILES, key=lambda p: -SEEK_PROFILES[p][0]):
+            seekth = SEEK_PROFILES[profile][0] >> 8
+            stops = len([r for r in peaks if r >= seekth])
+            if best == None or abs(stops - stations) < best[0]:
+                best = (abs(stops - stations), profile)
+
+        self.setseekprofile(best[1])
+        return best[1]
 
     def seekup(self):
         self.__seek(True)
@@ -219,51 +389,80 @@ class FMSi4703:
         self.__seek(False)
 
     def __seek(self, seekup):
-        self.__readregisters()
-        reg = self.__registers[POWERCFG] & ~((1 << SKMODE) | (1 << SEEKUP))
+        with self.__lock:
+            self.__readregisters()
+            startchannel = self.__registers[READCHAN] & 0x03FF
+            reg = self.__registers[POWERCFG] & ~((1 << SKMODE) | (1 << SEEKUP))
         
-        if (seekup == True):
-            reg |= (1 << SEEKUP);  # Set the Seek-up bit
-
-        reg |= (1 << SEEK);        # Start seek now
+            if (seekup == True):
+                reg |= (1 << SEEKUP);  # Set the Seek-up bit
+
+            reg |= (1 << SEEK);        # Start seek now
+
+            # save the registers and start seeking...
+            self.__registers[POWERCFG] = reg;
+            starttime = time.monotonic()
+            self.__writeregisters();
+            status = self.__waitforset()
+            duration = time.monotonic() - starttime
+
+            # Seek wraps at band limits (SKMODE = 0), failed seek went all round
+            channels = len(self.freqs)
+            if status & SFBL:
+                hops = channels
+            elif seekup == True:
+                hops = (self.channel - startchannel) % channels
+            else:
+                hops = (startchannel - self.channel) % channels
+
+            # Validity must not depend on the profile: AFC rail or, once
+            # calibrated, too close to the noise floor
+            if status & SFBL:
+                outcome = SEEK_FAIL
+            elif (status & AFCRL or (self.noisefloor != None and
+                  (status & RSSI) < self.noisefloor + STATION_MARGIN)):
+                outcome = SEEK_FALSESTOP
+            else:
+                outcome = SEEK_STATION
+            self.seekstats.record(self.seekprofile, duration, hops, outcome)
+            self.__tunenotify()
 
-        # save the registers and start seeking...
-        self.__registers[POWERCFG] = reg;
-        self.__writeregisters();
-        self.__waitforset()
-  
     def setmono(self, state):
-        self.mono = state
-        self.__readregisters()
-        if state == True:
-            self.__registers[POWERCFG] |= (1 << SETMONO) # set force mono bit
-        else:
-            self.__registers[POWERCFG] &= ~(1 << SETMONO) # clear force mono bit
-        self.__writeregisters()
+        with self.__lock:
+            self.mono = state
+            self.__readregisters()
+            if state == True:
+                self.__registers[POWERCFG] |= (1 << SETMONO) # set force mono bit
+            else:
+                self.__registers[POWERCFG] &= ~(1 << SETMONO) # clear force mono bit
+            self.__writeregisters()
 
     def setmute(self, state):
-        self.__readregisters()
-        if state == True:
-            self.__registers[POWERCFG] &= ~(1 << DMUTE) # clear mute bit
-        else:
-            self.__registers[POWERCFG] |= (1 << DMUTE)  # set mute bit
-        self.__writeregisters()
+        with self.__lock:
+            self.__readregisters()
+            if state == True:
+                self.__registers[POWERCFG] &= ~(1 << DMUTE) # clear mute bit
+            else:
+                self.__registers[POWERCFG] |= (1 << DMUTE)  # set mute bit
+            self.__writeregisters()
 
     def setsoftmute(self, state):
-        self.__readregisters()
-        if state == True:
-            self.__registers[POWERCFG] &= ~(1 << DSMUTE) # clear mute bit
-        else:
-            self.__registers[POWERCFG] |= (1 << DSMUTE)  # set mute bit
-        self.__writeregisters()
+        with self.__lock:
+            self.__readregisters()
+            if state == True:
+                self.__registers[POWERCFG] &= ~(1 << DSMUTE) # clear mute bit
+            else:
+                self.__registers[POWERCFG] |= (1 << DSMUTE)  # set mute bit
+            self.__writeregisters()
 
     def setrdsverbose(self, state):
-        self.__readregisters()
-        if state == True:
-            self.__registers[POWERCFG] |= (1 << RDSM) 
-        else:
-            self.__registers[POWERCFG] &= ~(1 << RDSM) 
-        self.__writeregisters()
+        with self.__lock:
+            self.__readregisters()
+            if state == True:
+                self.__registers[POWERCFG] |= (1 << RDSM) 
+            else:
+                self.__registers[POWERCFG] &= ~(1 << RDSM) 
+            self.__writeregisters()
 
     def getrdsstate(self):
         if (self.__registers[STATUSRSSI] & (RDSS)):
@@ -274,18 +473,33 @@ class FMSi4703:
     def getrssi(self):
         return self.__registers[STATUSRSSI] & RSSI
 
+    def getstereo(self):
+        if (self.__registers[STATUSRSSI] & SI):
+            return True
+        else:
+            return False
+
     def __waitforset(self):
         #Poll to see if STC is set
         while True:
             self.__readregisters()
             if((self.__registers[STATUSRSSI] & STC) != 0):
                 break       #tuning complete
+        status = self.__registers[STATUSRSSI]
         self.__readregisters()
+        self.channel = self.__registers[READCHAN] & 0x03FF
+        self.rds_init()     # RDS data belongs to the previous station
 
         # end the seek mode
         self.__registers[POWERCFG] &= ~(1 << SEEK)
         self.__registers[CHANNEL]  &= ~(1 << TUNE) #Clear the tune after a tune has completed
         self.__writeregisters()
+        return status
+
+    def __tunenotify(self):
+        if self.send_frequency != None:
+            self.send_frequency(self.tunedfrequency())
+        self.status_notify()
 
     def rds_init(self):
         self.__psname1 = [0] * 10
@@ -300,38 +514,53 @@ class FMSi4703:
         self.send_rdstext = text    # func(text)
         self.send_rdstime = time    # func(hours, mins)
 
+    def status_setcallback(self, frequency=None, status=None):
+        self.send_frequency = frequency # func(freq)    after tune or seek
+        self.send_status = status       # func(rssi, stereo)
+
+    def status_notify(self):
+        # Publish signal quality from the last register read
+        if self.send_status != None:
+            self.send_status(self.getrssi(), self.getstereo())
+
     def rds_interruptcall(self, ch):
-        print("CALL INT")
-        self.__readregisters()
-        self.rds_process(self.__registers[RDSA], self.__registers[RDSB], 
-                         self.__registers[RDSC], self.__registers[RDSD])
+        with self.__lock:
+            # Called from the RPi.GPIO thread, callbacks must not touch the GUI
+            self.__readregisters()
+            self.status_notify()
+            self.rds_process(self.__registers[RDSA], self.__registers[RDSB], 
+                             self.__registers[RDSC], self.__registers[RDSD])
 
     def rds_setinterrupt(self):
-        self.__readregisters()
-        self.__registers[SYSCONFIG1] |= (1 << RDSIEN)
-        self.__registers[SYSCONFIG1] |= (1 << GPIO2)
-        self.__writeregisters()
-        GPIO.setup(self.rdsINT, GPIO.IN)
-        GPIO.add_event_detect(self.rdsINT, GPIO.FALLING, callback=self.rds_interruptcall) 
-
+        with self.__lock:
+            self.__readregisters()
+            self.__registers[SYSCONFIG1] |= (1 << RDSIEN)
+            self.__registers[SYSCONFIG1] |= (1 << GPIO2)
+            self.__writeregisters()
+            GPIO.setup(self.rdsINT, GPIO.IN)
+            GPIO.add_event_detect(self.rdsINT, GPIO.FALLING, callback=self.rds_interruptcall) 
 
     def rds_check(self):
-        self.__readregisters()
-        # check for a RDS data set ready
-        if self.__registers[STATUSRSSI] & RDSR: 
-            self.rds_process(self.__registers[RDSA], self.__registers[RDSB], 
-                             self.__registers[RDSC], self.__registers[RDSD])
-            return True
-        else: 
-            return False
+        with self.__lock:
+            self.__readregisters()
+            self.status_notify()
+            # check for a RDS data set ready
+            if self.__registers[STATUSRSSI] & RDSR: 
+                self.rds_process(self.__registers[RDSA], self.__registers[RDSB], 
+                                 self.__registers[RDSC], self.__registers[RDSD])
+                return True
+            else: 
+                return False
 
     def rds_process(self, block1, block2, block3, block4):
         # reset all rds info
         if block1 == 0:
             self.rds_init()
             # send empty data
-            self.send_psname(str(self.__psname1))
-            self.send_rdstext(str(self.__rtext))
+            if self.send_psname != None:
+                self.send_psname("")
+            if self.send_rdstext != None:
+                self.send_rdstext("")
             return 
         
         # analyze Block 2
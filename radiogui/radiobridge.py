@@ -0,0 +1,64 @@
+"""
+    Qt adapter for the Si4703 driver
+    Driver callbacks come from the RPi.GPIO interrupt thread (RDS) or from
+    the caller of setfrequency/seek. They are turned into Qt signals, which
+    are delivered to the GUI thread through its event loop. Each signal is
+    emitted only when the value differs from the last one.
+
+    Licence: GNU GPLv2
+"""
+
+from PySide.QtCore import QObject, Signal
+
+
+class RadioBridge(QObject):
+    frequencyChanged = Signal(int)      # freq * 100, e.g. 10180
+    rssiChanged = Signal(int)
+    stereoChanged = Signal(bool)
+    psnameChanged = Signal(str)
+    rdstextChanged = Signal(str)
+    rdstimeChanged = Signal(int, int)   # hours, minutes
+
+    def __init__(self, radio, parent=None):
+        super().__init__(parent)
+        self.radio = radio
+        self.__last = {}
+        radio.status_setcallback(frequency=self.on_frequency,
+                                 status=self.on_status)
+        radio.rds_setcallback(psname=self.on_psname,
+                              text=self.on_rdstext,
+                              time=self.on_rdstime)
+
+    def __changed(self, key, value):
+        if self.__last.get(key) == value:
+            return False
+        self.__last[key] = value
+        return True
+
+    def on_frequency(self, freq):
+        if self.__changed("freq", freq):
+            # Station changed, RDS data belongs to the old one
+            self.__last.pop("psname", None)
+            self.__last.pop("text", None)
+            self.__last.pop("time", None)
+            self.frequencyChanged.emit(freq)
+
+    def on_status(self, rssi, stereo):
+        if self.__changed("rssi", rssi):
+            self.rssiChanged.emit(rssi)
+        if self.__changed("stereo", stereo):
+            self.stereoChanged.emit(stereo)
+
+    def on_psname(self, psname):
+        psname = psname.replace("\x00", "").strip()
+        if self.__changed("psname", psname):
+            self.psnameChanged.emit(psname)
+
+    def on_rdstext(self, text):
+        text = text.replace("\x00", "").strip()
+        if self.__changed("text", text):
+            self.rdstextChanged.emit(text)
+
+    def on_rdstime(self, hours, mins):
+        if self.__changed("time", (hours, mins)):
+            self.rdstimeChanged.emit(hours, mins)